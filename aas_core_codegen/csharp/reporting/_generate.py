@@ -1,6 +1,5 @@
 """Generate C# code for reporting errors by including the code directly."""
 
-import io
 import textwrap
 from typing import List
 
@@ -22,22 +21,9 @@ from aas_core_codegen.csharp.common import (
 )
 
 
-# fmt: off
-@ensure(
-    lambda result:
-    result.endswith('\n'),
-    "Trailing newline mandatory for valid end-of-files"
-)
-# fmt: on
-def generate(namespace: csharp_common.NamespaceIdentifier) -> str:
-    """
-    Generate the C# code for reporting errors.
-
-    The ``namespace`` defines the AAS C# namespace.
-    """
-    blocks = [
-        Stripped(
-            f"""\
+_BLOCKS = [
+    Stripped(
+        f"""\
 /// <summary>
 /// Capture a path segment of a value in a model.
 /// </summary>
@@ -45,9 +31,9 @@ public abstract class Segment
 {{
 {I}// Intentionally empty.
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 public class NameSegment : Segment
 {{
 {I}public readonly string Name;
@@ -56,9 +42,9 @@ public class NameSegment : Segment
 {II}Name = name;
 {I}}}
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 public class IndexSegment : Segment
 {{
 {I}public readonly int Index;
@@ -67,17 +53,17 @@ public class IndexSegment : Segment
 {II}Index = index;
 {I}}}
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 private static readonly System.Text.RegularExpressions.Regex VariableNameRe = (
 {I}new System.Text.RegularExpressions.Regex(
 {II}@"^[a-zA-Z_][a-zA-Z_0-9]*$"));"""
-        ),
-        # We have to indent a lot, so we do not use textwrap.dedent for better
-        # readability.
-        Stripped(
-            f"""\
+    ),
+    # We have to indent a lot, so we do not use textwrap.dedent for better
+    # readability.
+    Stripped(
+        f"""\
 /// <summary>
 /// Generate a JSON Path based on the path segments.
 /// </summary>
@@ -125,9 +111,9 @@ public static string GenerateJsonPath(
 {I}}}
 {I}return string.Join("", parts);
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 /// <summary>
 /// Escape special characters for XPath.
 /// </summary>
@@ -150,9 +136,9 @@ private static string EscapeForXPath(
 {III}.Replace("'", "&apos;")
 {I});
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 /// <summary>
 /// Generate a relative XPath based on the path segments.
 /// </summary>
@@ -183,9 +169,9 @@ public static string GenerateRelativeXPath(
 {I}}}
 {I}return string.Join("/", parts);
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 /// <summary>
 /// Represent an error during the deserialization or the verification.
 /// </summary>
@@ -205,31 +191,25 @@ public class Error
 {II}_pathSegments.AddFirst(segment);
 {I}}}
 }}"""
-        ),
-    ]
-
-    writer = io.StringIO()
-    writer.write(
-        f"""\
-namespace {namespace}
-{{
-{I}/// <summary>
-{I}/// Provide reporting for de/serialization and verification.
-{I}/// </summary>
-{I}public static class Reporting
-{I}{{
-"""
-    )
+    ),
+]  # type: List[Stripped]
 
-    for i, deserialize_block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
+_INDENTED_BODY = textwrap.indent("\n\n".join(_BLOCKS), II)
 
-        writer.write(textwrap.indent(deserialize_block, II))
 
-    writer.write(f"\n{I}}}  // public static class Reporting")
-    writer.write(f"\n}}  // namespace {namespace}")
+# fmt: off
+@ensure(
+    lambda result:
+    result.endswith('\n'),
+    "Trailing newline mandatory for valid end-of-files"
+)
+# fmt: on
+def generate(namespace: csharp_common.NamespaceIdentifier) -> str:
+    """
+    Generate the C# code for reporting errors.
 
+    The ``namespace`` defines the AAS C# namespace.
+    """
     using_directives = []  # type: List[Stripped]
     using_directives.extend(
         csharp_common.generate_using_aas_directive_if_necessary(namespace)
@@ -244,23 +224,24 @@ using System.Collections.Generic;  // can't alias"""
         )
     )
 
-    # pylint: disable=line-too-long
-    blocks = [
-        csharp_common.WARNING,
-        Stripped("\n".join(using_directives)),
-        Stripped(writer.getvalue()),
-        csharp_common.WARNING,
-    ]
-
-    writer = io.StringIO()
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
-
-        assert not block.startswith("\n")
-        assert not block.endswith("\n")
-        writer.write(block)
-
-    writer.write("\n")
-
-    return writer.getvalue()
+    return (
+        "\n\n".join(
+            [
+                csharp_common.WARNING,
+                "\n".join(using_directives),
+                f"""\
+namespace {namespace}
+{{
+{I}/// <summary>
+{I}/// Provide reporting for de/serialization and verification.
+{I}/// </summary>
+{I}public static class Reporting
+{I}{{
+{_INDENTED_BODY}
+{I}}}  // public static class Reporting
+}}  // namespace {namespace}""",
+                csharp_common.WARNING,
+            ]
+        )
+        + "\n"
+    )
@@ -1,5 +1,7 @@
 """Generate the Golang code for reporting errors by including the code directly."""
 
+from typing import List
+
 from icontract import ensure
 
 from aas_core_codegen.common import (
@@ -17,52 +19,43 @@ from aas_core_codegen.golang.common import (
 )
 
 
-# fmt: off
-@ensure(
-    lambda result:
-    result.endswith('\n'),
-    "Trailing newline mandatory for valid end-of-files"
-)
-# fmt: on
-def generate() -> str:
-    """Generate the Golang code for reporting errors."""
-    blocks = [
-        Stripped(
-            """\
+_BLOCKS = [
+    Stripped(
+        """\
 // Package reporting provides structures and functions for reporting of errors.
 package reporting"""
-        ),
-        golang_common.WARNING,
-        Stripped(
-            f"""\
+    ),
+    golang_common.WARNING,
+    Stripped(
+        f"""\
 import (
 {I}"fmt"
 {I}"strings"
 {I}"strconv"
 )"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 type NameSegment struct{{
 {I}Name string
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 type IndexSegment struct{{
 {I}Index int
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 type Path struct{{
 {I}// A segments is expected to be either a name segment or an index segment.
 {I}segments []interface{{}}
 {I}start int
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Prepend the segment to the path.
 //
 // Grow segments exponentially if there is no place.
@@ -83,23 +76,23 @@ func (p *Path) prepend(segment interface{{}}) {{
 {II}p.segments[p.start] = segment
 {I}}}
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Prepend the name segment to the path.
 func (p *Path) PrependName(segment *NameSegment) {{
 {I}p.prepend(segment)
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Prepend the index segment to the path.
 func (p *Path) PrependIndex(segment *IndexSegment) {{
 {I}p.prepend(segment)
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Apply the `callback` on each segment.
 //
 // The segment object is either a [NameSegment] or a [IndexSegment].
@@ -109,9 +102,9 @@ func (p *Path) OverSegments(callback func(interface{{}})) {{
 {II}callback(p.segments[i])
 {I}}}
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Translate the path to a JSON path.
 //
 // The name segments are expected to denote the names of the properties
@@ -145,9 +138,9 @@ func ToJSONPath(p *Path) string {{
 {I}}})
 {I}return b.String()
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Translate the path to a Golang access path.
 //
 // The name segments are expected to denote the names of the properties
@@ -160,9 +153,9 @@ func ToGolangPath(p *Path) string {{
 {I}// of JSON property names).
 {I}return ToJSONPath(p)
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 var replacerForXPath = strings.NewReplacer(
 {I}"/", "&#47;",
 {I}"<", "&lt;",
@@ -170,18 +163,18 @@ var replacerForXPath = strings.NewReplacer(
 {I}"\\"", "&quot;",
 {I}"'", "&apos;",
 )"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Escape special characters for XPath.
 func escapeForXPath(
 {I}text string,
 ) string {{
 {I}return replacerForXPath.Replace(text)
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 // Generate a relative XPath based on the path segments.
 //
 // Leave out the leading slash (`/`). This is helpful if we
@@ -211,8 +204,20 @@ func ToRelativeXPath(
 {I}}})
 {I}return b.String()
 }}"""
-        ),
-        golang_common.WARNING,
-    ]
+    ),
+    golang_common.WARNING,
+]  # type: List[Stripped]
+
+_CODE = "\n\n".join(_BLOCKS) + "\n"
 
-    return "\n\n".join(blocks) + "\n"
+
+# fmt: off
+@ensure(
+    lambda result:
+    result.endswith('\n'),
+    "Trailing newline mandatory for valid end-of-files"
+)
+# fmt: on
+def generate() -> str:
+    """Generate the Golang code for reporting errors."""
+    return _CODE
@@ -240,7 +240,6 @@ def _topologically_sort(
 
     def visit(cls: parse.Class) -> None:
         nonlocal visited_more_than_once
-        nonlocal result
 
         if visited_more_than_once:
             return
@@ -1,6 +1,5 @@
 """Generate Java code for reporting errors by including the code directly."""
 
-import io
 import textwrap
 from typing import List
 
@@ -21,32 +20,18 @@ from aas_core_codegen.csharp.common import (
 )
 
 
-# fmt: off
-@ensure(
-    lambda result:
-    result.endswith('\n'),
-    "Trailing newline mandatory for valid end-of-files"
-)
-# fmt: on
-def generate(package: java_common.PackageIdentifier) -> str:
-    """
-    Generate the Java code for reporting errors.
-
-    The ``package`` defines the root Java package.
-    """
-
-    blocks = [
-        Stripped(
-            f"""\
+_BLOCKS = [
+    Stripped(
+        f"""\
 /**
  * Capture a path segment of a value in a model.
  */
 public static abstract class Segment {{
 {I}// Intentionally empty.
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 public static class NameSegment extends Segment {{
 {I}private final String name;
 {I}public NameSegment(String name) {{
@@ -57,9 +42,9 @@ public static class NameSegment extends Segment {{
 {II}return name;
 {I}}}
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 public static class IndexSegment extends Segment{{
 {I}private final Integer index;
 {I}public IndexSegment(int index) {{
@@ -69,15 +54,15 @@ public static class IndexSegment extends Segment{{
 {II}return index;
 {I}}}
 }}"""
-        ),
-        Stripped(
-            """\
+    ),
+    Stripped(
+        """\
 private static final Pattern variableNameRe = Pattern.compile("^[a-zA-Z_][a-zA-Z_0-9]*$");"""
-        ),
-        # We have to indent a lot, so we do not use textwrap.dedent for better
-        # readability.
-        Stripped(
-            f"""\
+    ),
+    # We have to indent a lot, so we do not use textwrap.dedent for better
+    # readability.
+    Stripped(
+        f"""\
 /**
  * Generate a JSON Path based on the path segments.
  *
@@ -124,9 +109,9 @@ public static String generateJsonPath(Collection<Segment> segments) {{
 {I}}}
 {I}return String.join("", parts);
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 /**
  * Escape special characters for XPath.
  */
@@ -139,9 +124,9 @@ return text
 {II}.replace("\\"", "&quot;")
 {II}.replace("'", "&apos;");
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 /**
  * Generate a relative XPath based on the path segments.
  *
@@ -168,9 +153,9 @@ public static String generateRelativeXPath(Collection<Segment> segments) {{
 {I}}});
 {I}return String.join("/", parts);
 }}"""
-        ),
-        Stripped(
-            f"""\
+    ),
+    Stripped(
+        f"""\
 /**
  * Represent an error during the deserialization or the verification.
  */
@@ -194,12 +179,30 @@ public static class Error {{
 {II}return pathSegments;
 {I}}}
 }}"""
-        ),
-    ]  # type: List[Stripped]
+    ),
+]  # type: List[Stripped]
 
-    writer = io.StringIO()
-    writer.write(
-        f"""\
+_INDENTED_BODY = textwrap.indent("\n\n".join(_BLOCKS), I)
+
+
+# fmt: off
+@ensure(
+    lambda result:
+    result.endswith('\n'),
+    "Trailing newline mandatory for valid end-of-files"
+)
+# fmt: on
+def generate(package: java_common.PackageIdentifier) -> str:
+    """
+    Generate the Java code for reporting errors.
+
+    The ``package`` defines the root Java package.
+    """
+    return (
+        "\n\n".join(
+            [
+                java_common.WARNING,
+                f"""\
 package {package}.reporting;
 
 import java.util.ArrayList;
@@ -217,32 +220,10 @@ import java.util.regex.Pattern;
  */
 public class Reporting
 {{
-"""
+{_INDENTED_BODY}
+}}""",
+                java_common.WARNING,
+            ]
+        )
+        + "\n"
     )
-
-    for i, deserialize_block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
-
-        writer.write(textwrap.indent(deserialize_block, I))
-
-    writer.write("\n}")
-
-    blocks = [
-        java_common.WARNING,
-        Stripped(writer.getvalue()),
-        java_common.WARNING,
-    ]
-
-    writer = io.StringIO()
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
-
-        assert not block.startswith("\n")
-        assert not block.endswith("\n")
-        writer.write(block)
-
-    writer.write("\n")
-
-    return writer.getvalue()
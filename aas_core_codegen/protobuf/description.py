@@ -1,7 +1,6 @@
 """Render descriptions to ProtoBuf documentation comments."""
 
 import abc
-import collections
 import io
 import itertools
 import textwrap
@@ -10,7 +9,7 @@ from typing import (
     Tuple,
     Optional,
     List,
-    OrderedDict,
+    Mapping,
     Union,
     Sequence,
     TypeVar,
@@ -105,11 +104,11 @@ class _Element(_Node):
     def __init__(
         self,
         name: str,
-        attrs: Optional[OrderedDict[str, str]] = None,
+        attrs: Optional[Mapping[str, str]] = None,
         children: Optional[_List] = None,
     ) -> None:
         self.name = name
-        self.attrs = collections.OrderedDict() if attrs is None else attrs
+        self.attrs = dict() if attrs is None else attrs
         self.children = _List(items=[]) if children is None else children
 
     def accept(self, visitor: "_NodeVisitor") -> None:
@@ -210,9 +209,7 @@ class _ElementRenderer(intermediate_doc.DocutilsElementTransformer[_NodeUnion]):
         prefixed_name = f"Aas.{name}"
 
         return (
-            _Element(
-                name="see", attrs=collections.OrderedDict([("cref", prefixed_name)])
-            ),
+            _Element(name="see", attrs={"cref": prefixed_name}),
             None,
         )
 
@@ -274,9 +271,7 @@ class _ElementRenderer(intermediate_doc.DocutilsElementTransformer[_NodeUnion]):
         prefixed_cref = f"Aas.{cref}"
 
         return (
-            _Element(
-                name="see", attrs=collections.OrderedDict([("cref", prefixed_cref)])
-            ),
+            _Element(name="see", attrs={"cref": prefixed_cref}),
             None,
         )
 
@@ -286,9 +281,7 @@ class _ElementRenderer(intermediate_doc.DocutilsElementTransformer[_NodeUnion]):
         arg_name = proto_naming.argument_name(Identifier(element.reference))
 
         return (
-            _Element(
-                name="paramref", attrs=collections.OrderedDict([("name", arg_name)])
-            ),
+            _Element(name="paramref", attrs={"name": arg_name}),
             None,
         )
 
@@ -304,7 +297,7 @@ class _ElementRenderer(intermediate_doc.DocutilsElementTransformer[_NodeUnion]):
         cref = f"Aas.Constants.{constant_as_prop_name}"
 
         return (
-            _Element(name="see", attrs=collections.OrderedDict([("cref", cref)])),
+            _Element(name="see", attrs={"cref": cref}),
             None,
         )
 
@@ -1042,7 +1035,7 @@ def _render_description_of_signature(
             param_nodes.append(
                 _Element(
                     name="param",
-                    attrs=collections.OrderedDict([("name", name)]),
+                    attrs={"name": name},
                     children=_List(items=[returns]),
                 )
             )
@@ -1,11 +1,20 @@
 """Generate XML Schema Definition (XSD) corresponding to the meta-model."""
 
 import re
+import sys
 import xml.etree.ElementTree as ET
 
-# noinspection PyUnresolvedReferences
-import xml.dom.minidom
-from typing import TextIO, MutableMapping, Optional, Tuple, List, Sequence, Any
+from typing import (
+    TextIO,
+    Dict,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    List,
+    Sequence,
+    Any,
+)
 
 from icontract import ensure, require
 import greenery
@@ -24,20 +33,25 @@ from aas_core_codegen.parse import retree as parse_retree
 
 assert aas_core_codegen.xsd.__doc__ == __doc__
 
+_TypeNames = Mapping[intermediate.OurType, Identifier]
+
+_ClassNames = Mapping[intermediate.ClassUnion, Identifier]
+
+_ChoiceAttributes = Mapping[intermediate.ConcreteClass, Dict[str, str]]
 
-def _define_for_enumeration(enumeration: intermediate.Enumeration) -> List[ET.Element]:
+
+def _define_for_enumeration(
+    enumeration: intermediate.Enumeration, type_names: _TypeNames
+) -> List[ET.Element]:
     """
     Generate the definitions for an ``enumeration``.
     The root element is to be *extended* with the resulting list.
     """
-    restriction = ET.Element("xs:restriction", {"base": "xs:string"})
-    for literal in enumeration.literals:
-        restriction.append(ET.Element("xs:enumeration", {"value": literal.value}))
+    element = ET.Element("xs:simpleType", {"name": type_names[enumeration]})
 
-    element = ET.Element(
-        "xs:simpleType", {"name": xsd_naming.type_name(enumeration.name)}
-    )
-    element.append(restriction)
+    restriction = ET.SubElement(element, "xs:restriction", {"base": "xs:string"})
+    for literal in enumeration.literals:
+        ET.SubElement(restriction, "xs:enumeration", {"value": literal.value})
 
     return [element]
 
@@ -263,25 +277,22 @@ def _generate_xs_restriction(
 
         assert translated_pattern is not None
 
-        pattern = ET.Element(
+        ET.SubElement(
+            restriction,
             "xs:pattern",
             {"value": translated_pattern},
         )
 
-        restriction.append(pattern)
-
     if len_constraint is not None:
         if len_constraint.min_value is not None:
-            min_length = ET.Element(
-                "xs:minLength", {"value": str(len_constraint.min_value)}
+            ET.SubElement(
+                restriction, "xs:minLength", {"value": str(len_constraint.min_value)}
             )
-            restriction.append(min_length)
 
         if len_constraint.max_value is not None:
-            max_length = ET.Element(
-                "xs:maxLength", {"value": str(len_constraint.max_value)}
+            ET.SubElement(
+                restriction, "xs:maxLength", {"value": str(len_constraint.max_value)}
             )
-            restriction.append(max_length)
 
     return restriction, None
 
@@ -357,11 +368,10 @@ def _generate_xs_element_for_a_primitive_property(
             },
         )
     else:
-        xs_simple_type = ET.Element("xs:simpleType")
-        xs_simple_type.append(xs_restriction)
-
         xs_element = ET.Element("xs:element", {"name": naming.xml_property(prop.name)})
-        xs_element.append(xs_simple_type)
+
+        xs_simple_type = ET.SubElement(xs_element, "xs:simpleType")
+        xs_simple_type.append(xs_restriction)
 
     return xs_element, None
 
@@ -370,6 +380,8 @@ def _generate_xs_element_for_a_primitive_property(
 def _generate_xs_element_for_a_list_property(
     prop: intermediate.Property,
     len_constraint: Optional[infer_for_schema.LenConstraint],
+    type_names: _TypeNames,
+    choice_group_names: _ClassNames,
 ) -> Tuple[Optional[ET.Element], Optional[Error]]:
     """Generate the ``xs:element`` for a list property."""
     type_anno = intermediate.beneath_optional(prop.type_annotation)
@@ -422,8 +434,15 @@ def _generate_xs_element_for_a_list_property(
             # applies to concrete classes, but there is no choice group for the abstract
             # classes without descendants either.
             if len(our_type.concrete_descendants) > 0:
-                choice_group_name = xsd_naming.choice_group_name(our_type.name)
-                xs_group = ET.Element(
+                xs_element = ET.Element(
+                    "xs:element", {"name": naming.xml_property(prop.name)}
+                )
+                xs_complex_type = ET.SubElement(xs_element, "xs:complexType")
+                xs_sequence = ET.SubElement(xs_complex_type, "xs:sequence")
+
+                choice_group_name = choice_group_names[our_type]
+                ET.SubElement(
+                    xs_sequence,
                     "xs:group",
                     {
                         "ref": choice_group_name,
@@ -431,37 +450,23 @@ def _generate_xs_element_for_a_list_property(
                         "maxOccurs": max_occurs,
                     },
                 )
-
-                xs_sequence = ET.Element("xs:sequence")
-                xs_sequence.append(xs_group)
-
-                xs_complex_type = ET.Element("xs:complexType")
-                xs_complex_type.append(xs_sequence)
-
+            else:
                 xs_element = ET.Element(
                     "xs:element", {"name": naming.xml_property(prop.name)}
                 )
-                xs_element.append(xs_complex_type)
-            else:
-                xs_element_inner = ET.Element(
+                xs_complex_type = ET.SubElement(xs_element, "xs:complexType")
+                xs_sequence = ET.SubElement(xs_complex_type, "xs:sequence")
+
+                ET.SubElement(
+                    xs_sequence,
                     "xs:element",
                     {
                         "name": naming.xml_class_name(our_type.name),
-                        "type": xsd_naming.type_name(our_type.name),
+                        "type": type_names[our_type],
                         "minOccurs": min_occurs,
                         "maxOccurs": max_occurs,
                     },
                 )
-                xs_sequence = ET.Element("xs:sequence")
-                xs_sequence.append(xs_element_inner)
-
-                xs_complex_type = ET.Element("xs:complexType")
-                xs_complex_type.append(xs_sequence)
-
-                xs_element = ET.Element(
-                    "xs:element", {"name": naming.xml_property(prop.name)}
-                )
-                xs_element.append(xs_complex_type)
 
         elif isinstance(our_type, intermediate.ConstrainedPrimitive):
             return None, Error(
@@ -488,6 +493,8 @@ def _generate_xs_element_for_a_property(
     prop: intermediate.Property,
     len_constraint: Optional[infer_for_schema.LenConstraint],
     pattern_constraints: Optional[Sequence[infer_for_schema.PatternConstraint]],
+    type_names: _TypeNames,
+    choice_group_names: _ClassNames,
 ) -> Tuple[Optional[ET.Element], Optional[Error]]:
     """Generate the definition of an ``xs:element`` for a property."""
     type_anno = intermediate.beneath_optional(prop.type_annotation)
@@ -512,7 +519,7 @@ def _generate_xs_element_for_a_property(
                 "xs:element",
                 {
                     "name": naming.xml_property(prop.name),
-                    "type": xsd_naming.type_name(our_type.name),
+                    "type": type_names[our_type],
                 },
             )
 
@@ -538,26 +545,22 @@ def _generate_xs_element_for_a_property(
             # which we still want to include in the schema. We simply generate an empty
             # element in the schema for such abstract classes without descendants.
             if len(our_type.concrete_descendants) > 0:
-                xs_sequence = ET.Element("xs:sequence")
-                xs_sequence.append(
-                    ET.Element(
-                        "xs:group", {"ref": xsd_naming.choice_group_name(our_type.name)}
-                    )
-                )
-
-                xs_complex_type = ET.Element("xs:complexType")
-                xs_complex_type.append(xs_sequence)
-
                 xs_element = ET.Element(
                     "xs:element", {"name": naming.xml_property(prop.name)}
                 )
-                xs_element.append(xs_complex_type)
+                xs_complex_type = ET.SubElement(xs_element, "xs:complexType")
+                xs_sequence = ET.SubElement(xs_complex_type, "xs:sequence")
+                ET.SubElement(
+                    xs_sequence,
+                    "xs:group",
+                    {"ref": choice_group_names[our_type]},
+                )
             else:
                 xs_element = ET.Element(
                     "xs:element",
                     {
                         "name": naming.xml_property(prop.name),
-                        "type": xsd_naming.type_name(our_type.name),
+                        "type": type_names[our_type],
                     },
                 )
         else:
@@ -565,7 +568,10 @@ def _generate_xs_element_for_a_property(
 
     elif isinstance(type_anno, intermediate.ListTypeAnnotation):
         xs_element, error = _generate_xs_element_for_a_list_property(
-            prop=prop, len_constraint=len_constraint
+            prop=prop,
+            len_constraint=len_constraint,
+            type_names=type_names,
+            choice_group_names=choice_group_names,
         )
         if error is not None:
             return None, error
@@ -587,6 +593,8 @@ def _generate_xs_element_for_a_property(
 def _define_properties(
     cls: intermediate.ClassUnion,
     constraints_by_property: infer_for_schema.ConstraintsByProperty,
+    type_names: _TypeNames,
+    choice_group_names: _ClassNames,
 ) -> Tuple[Optional[List[ET.Element]], Optional[List[Error]]]:
     """Define the properties of the ``cls`` as a sequence of tags."""
     sequence = []  # type: List[ET.Element]
@@ -608,6 +616,8 @@ def _define_properties(
             prop=prop,
             len_constraint=len_constraint,
             pattern_constraints=pattern_constraints,
+            type_names=type_names,
+            choice_group_names=choice_group_names,
         )
         if error is not None:
             errors.append(error)
@@ -624,10 +634,16 @@ def _define_properties(
 def _generate_xs_group_for_class(
     cls: intermediate.ClassUnion,
     constraints_by_property: infer_for_schema.ConstraintsByProperty,
+    type_names: _TypeNames,
+    group_names: _ClassNames,
+    choice_group_names: _ClassNames,
 ) -> Tuple[Optional[ET.Element], Optional[Error]]:
     """Generate the ``xs:group`` representation of the class properties."""
     properties, properties_errors = _define_properties(
-        cls=cls, constraints_by_property=constraints_by_property
+        cls=cls,
+        constraints_by_property=constraints_by_property,
+        type_names=type_names,
+        choice_group_names=choice_group_names,
     )
 
     if properties_errors is not None:
@@ -639,18 +655,14 @@ def _generate_xs_group_for_class(
 
     assert properties is not None
 
-    xs_sequence = ET.Element("xs:sequence")
+    xs_group = ET.Element("xs:group", {"name": group_names[cls]})
+
+    xs_sequence = ET.SubElement(xs_group, "xs:sequence")
     for inheritance in cls.inheritances:
-        inheritance_xs_group = ET.Element(
-            "xs:group", {"ref": xsd_naming.group_name(inheritance.name)}
-        )
-        xs_sequence.append(inheritance_xs_group)
+        ET.SubElement(xs_sequence, "xs:group", {"ref": group_names[inheritance]})
 
     xs_sequence.extend(properties)
 
-    xs_group = ET.Element("xs:group", {"name": xsd_naming.group_name(cls.name)})
-    xs_group.append(xs_sequence)
-
     return xs_group, None
 
 
@@ -658,6 +670,9 @@ def _generate_xs_group_for_class(
 def _define_for_class(
     cls: intermediate.ClassUnion,
     constraints_by_property: infer_for_schema.ConstraintsByProperty,
+    type_names: _TypeNames,
+    group_names: _ClassNames,
+    choice_group_names: _ClassNames,
 ) -> Tuple[Optional[List[ET.Element]], Optional[Error]]:
     """
     Generate the definitions for the class ``cls``.
@@ -670,55 +685,42 @@ def _define_for_class(
     # See: https://stackoverflow.com/questions/1198755/xml-schemas-with-multiple-inheritance
 
     xs_group, xs_group_error = _generate_xs_group_for_class(
-        cls=cls, constraints_by_property=constraints_by_property
+        cls=cls,
+        constraints_by_property=constraints_by_property,
+        type_names=type_names,
+        group_names=group_names,
+        choice_group_names=choice_group_names,
     )
     if xs_group_error is not None:
         return None, xs_group_error
 
     assert xs_group is not None
 
-    xs_group_ref = ET.Element("xs:group", {"ref": xsd_naming.group_name(cls.name)})
-
-    xs_sequence = ET.Element("xs:sequence")
-    xs_sequence.append(xs_group_ref)
+    complex_type = ET.Element("xs:complexType", {"name": type_names[cls]})
 
-    complex_type = ET.Element(
-        "xs:complexType", {"name": xsd_naming.type_name(cls.name)}
-    )
-    complex_type.append(xs_sequence)
+    xs_sequence = ET.SubElement(complex_type, "xs:sequence")
+    ET.SubElement(xs_sequence, "xs:group", {"ref": group_names[cls]})
 
     return [xs_group, complex_type], None
 
 
 @require(lambda cls: len(cls.concrete_descendants) > 0)
-def _generate_choice_group(cls: intermediate.ClassUnion) -> ET.Element:
+def _generate_choice_group(
+    cls: intermediate.ClassUnion,
+    choice_group_names: _ClassNames,
+    choice_attributes: _ChoiceAttributes,
+) -> ET.Element:
     """Generate a group that defines a choice of concrete descendants."""
-    xs_choice = ET.Element("xs:choice")
+    xs_group = ET.Element("xs:group", {"name": choice_group_names[cls]})
+
+    xs_choice = ET.SubElement(xs_group, "xs:choice")
 
     if isinstance(cls, intermediate.ConcreteClass):
-        xs_choice.append(
-            ET.Element(
-                "xs:element",
-                {
-                    "name": naming.xml_class_name(cls.name),
-                    "type": xsd_naming.type_name(cls.name),
-                },
-            )
-        )
+        ET.SubElement(xs_choice, "xs:element", choice_attributes[cls])
 
     for descendant in cls.concrete_descendants:
-        xs_choice.append(
-            ET.Element(
-                "xs:element",
-                {
-                    "name": naming.xml_class_name(descendant.name),
-                    "type": xsd_naming.type_name(descendant.name),
-                },
-            )
-        )
+        ET.SubElement(xs_choice, "xs:element", choice_attributes[descendant])
 
-    xs_group = ET.Element("xs:group", {"name": xsd_naming.choice_group_name(cls.name)})
-    xs_group.append(xs_choice)
     return xs_group
 
 
@@ -828,6 +830,45 @@ def _sort_by_tags_and_names_in_place(root: ET.Element) -> None:
     root[:] = children
 
 
+def _indent_in_place(element: ET.Element) -> None:
+    """
+    Indent the ``element`` and its descendants in place for pretty-printing.
+
+    The indentation follows :py:func:`xml.etree.ElementTree.indent`. We use this
+    function only in Python 3.8 where the latter is not available.
+    """
+    # NOTE (agent, 2026-10-15):
+    # We walk the tree with an explicit stack instead of recursion, and re-use
+    # the indentation strings across the levels.
+    indentations = ["\n"]  # type: List[str]
+
+    stack = [(element, 0)]  # type: List[Tuple[ET.Element, int]]
+    while len(stack) > 0:
+        parent, level = stack.pop()
+
+        if len(parent) == 0:
+            continue
+
+        if len(indentations) == level + 1:
+            indentations.append(indentations[-1] + "  ")
+
+        child_indentation = indentations[level + 1]
+
+        if parent.text is None or parent.text.strip() == "":
+            parent.text = child_indentation
+
+        for child in parent:
+            if child.tail is None or child.tail.strip() == "":
+                child.tail = child_indentation
+
+            stack.append((child, level + 1))
+
+        # The tail of the last child closes the parent on its own line.
+        last_child = parent[-1]
+        if last_child.tail is None or last_child.tail.strip() == "":
+            last_child.tail = indentations[level]
+
+
 _EXPLANATION_ABOUT_WHY_WE_EXPECT_VALUE_DATA_TYPE = (
     "(mristin, 2022-09-02) "
     'We provide an internal data type ``valueDataType`` to correspond to "any XSD '
@@ -852,8 +893,12 @@ _EXPLANATION_ABOUT_WHY_WE_EXPECT_VALUE_DATA_TYPE = (
 def _generate(
     symbol_table: intermediate.SymbolTable,
     spec_impls: specific_implementations.SpecificImplementations,
-) -> Tuple[Optional[str], Optional[List[Error]]]:
-    """Generate the XML Schema Definition (XSD) based on the ``symbol_table."""
+) -> Tuple[Optional[bytes], Optional[List[Error]]]:
+    """
+    Generate the XML Schema Definition (XSD) based on the ``symbol_table``.
+
+    The schema is returned encoded in UTF-8.
+    """
     root_element_key = specific_implementations.ImplementationKey("root_element.xml")
 
     root_element_as_text = spec_impls.get(root_element_key, None)
@@ -866,9 +911,32 @@ def _generate(
             )
         ]
 
-    root: ET.Element
+    # NOTE (agent, 2026-10-15):
+    # ElementTree removes the ``xmlns`` property from the parsed root element.
+    # We pick it up from the namespace events in the same parse instead of parsing
+    # the snippet a second time.
+    parser = ET.XMLPullParser(events=("start-ns", "start"))
+
+    root: Optional[ET.Element] = None
+
+    # Prefix 🠒 namespace, as declared on the root element
+    namespaces = dict()  # type: MutableMapping[str, str]
+
     try:
-        root = ET.fromstring(root_element_as_text)
+        parser.feed(root_element_as_text)
+        parser.close()
+
+        for event, item in parser.read_events():
+            if root is not None:
+                break
+
+            if event == "start-ns":
+                prefix, uri = item
+                namespaces[prefix] = uri
+            elif event == "start":
+                root = item
+            else:
+                raise AssertionError(f"Unexpected event: {event!r}")
     except ET.ParseError as err:
         return None, [
             Error(
@@ -876,13 +944,10 @@ def _generate(
             )
         ]
 
-    # NOTE (mristin, 2022-03-30):
-    # We need to use minidom to extract the ``xmlns`` property as ElementTree removes
-    # it.
-    # noinspection PyUnresolvedReferences
-    minidom_doc = xml.dom.minidom.parseString(root_element_as_text)
+    assert root is not None
 
-    if not minidom_doc.documentElement.hasAttribute("xmlns"):
+    xmlns = namespaces.get("", None)
+    if xmlns is None:
         return None, [
             Error(
                 None,
@@ -891,8 +956,6 @@ def _generate(
             )
         ]
 
-    xmlns = minidom_doc.documentElement.getAttribute("xmlns")
-
     if xmlns != symbol_table.meta_model.xml_namespace:
         return None, [
             Error(
@@ -905,7 +968,8 @@ def _generate(
             )
         ]
 
-    if not minidom_doc.documentElement.hasAttribute("targetNamespace"):
+    target_namespace = root.attrib.get("targetNamespace", None)
+    if target_namespace is None:
         return None, [
             Error(
                 None,
@@ -914,7 +978,6 @@ def _generate(
             )
         ]
 
-    target_namespace = minidom_doc.documentElement.getAttribute("targetNamespace")
     if target_namespace != symbol_table.meta_model.xml_namespace:
         return None, [
             Error(
@@ -1015,23 +1078,45 @@ def _generate(
         intermediate.collect_ids_of_our_types_in_properties(symbol_table=symbol_table)
     )
 
+    # NOTE (agent, 2026-10-15):
+    # We compute the type and group names only once as they are referenced over
+    # and over again in properties, groups and choice groups.
+    type_names = {
+        our_type: xsd_naming.type_name(our_type.name)
+        for our_type in symbol_table.our_types
+    }  # type: _TypeNames
+
+    group_names = {
+        cls: xsd_naming.group_name(cls.name) for cls in symbol_table.classes
+    }  # type: _ClassNames
+
+    choice_group_names = {
+        cls: xsd_naming.choice_group_name(cls.name) for cls in symbol_table.classes
+    }  # type: _ClassNames
+
+    # NOTE (agent, 2026-10-15):
+    # A concrete class appears in the choice group of each of its ancestors, so we
+    # prepare its attributes only once. ElementTree copies the attributes into each
+    # element, so the elements do not share them.
+    choice_attributes = {
+        cls: {"name": naming.xml_class_name(cls.name), "type": type_names[cls]}
+        for cls in symbol_table.concrete_classes
+    }  # type: _ChoiceAttributes
+
     # region Specify ``valueDataType``
 
     assert value_data_type_cls is not None
 
-    value_data_type_element = ET.Element(
-        "xs:simpleType", attrib={"name": "valueDataType"}
+    value_data_type_element = ET.SubElement(
+        root, "xs:simpleType", attrib={"name": "valueDataType"}
     )
 
-    value_data_type_element.append(
-        ET.Element(
-            "xs:restriction",
-            attrib={"base": "xs:string"},
-        )
+    ET.SubElement(
+        value_data_type_element,
+        "xs:restriction",
+        attrib={"base": "xs:string"},
     )
 
-    root.append(value_data_type_element)
-
     # endregion
 
     for our_type in symbol_table.our_types:
@@ -1062,7 +1147,9 @@ def _generate(
                 if id(our_type) not in ids_of_our_types_in_properties:
                     continue
 
-                elements = _define_for_enumeration(enumeration=our_type)
+                elements = _define_for_enumeration(
+                    enumeration=our_type, type_names=type_names
+                )
 
             elif isinstance(our_type, intermediate.ConstrainedPrimitive):
                 # NOTE (mristin, 2022-03-30):
@@ -1077,7 +1164,11 @@ def _generate(
                 our_type, (intermediate.AbstractClass, intermediate.ConcreteClass)
             ):
                 elements, definition_error = _define_for_class(
-                    cls=our_type, constraints_by_property=constraints_by_class[our_type]
+                    cls=our_type,
+                    constraints_by_property=constraints_by_class[our_type],
+                    type_names=type_names,
+                    group_names=group_names,
+                    choice_group_names=choice_group_names,
                 )
 
                 if definition_error is not None:
@@ -1087,7 +1178,11 @@ def _generate(
                 assert elements is not None
 
                 if len(our_type.concrete_descendants) > 0:
-                    choice_group = _generate_choice_group(cls=our_type)
+                    choice_group = _generate_choice_group(
+                        cls=our_type,
+                        choice_group_names=choice_group_names,
+                        choice_attributes=choice_attributes,
+                    )
                     elements.append(choice_group)
             else:
                 assert_never(our_type)
@@ -1099,9 +1194,7 @@ def _generate(
         return None, errors
 
     # Tag name 🠒 (name 🠒 element)
-    observed_definitions = dict(
-        dict()
-    )  # type: MutableMapping[str, MutableMapping[str, ET.Element]]
+    observed_definitions: MutableMapping[str, MutableMapping[str, ET.Element]] = {}
 
     for element in root:
         name = element.attrib.get("name", None)
@@ -1144,15 +1237,22 @@ def _generate(
     # element. Therefore, we need to add it here manually.
     root.attrib["xmlns"] = xmlns
 
-    text = ET.tostring(root, encoding="unicode", method="xml")
+    # NOTE (agent, 2026-10-15):
+    # We indent the tree in place so that we serialize it only once. We use
+    # ``ET.indent`` if available, and fall back to our own indentation in Python 3.8.
+    if sys.version_info >= (3, 9):
+        ET.indent(root, space="  ")
+    else:
+        _indent_in_place(root)
 
-    # NOTE (mristin, 2021-11-23):
-    # This approach is slow, but effective. As long as the meta-model is not too big,
-    # this should work.
-    # noinspection PyUnresolvedReferences
-    pretty_text = xml.dom.minidom.parseString(text).toprettyxml(indent="  ")
+    # NOTE (agent, 2026-10-15):
+    # We serialize directly to UTF-8 so that the schema is encoded only once.
+    # ElementTree omits the XML declaration for UTF-8, so we prepend it ourselves.
+    # We keep the declaration without the encoding as in the previously published
+    # schemas so that the downstream diffs stay minimal.
+    data = ET.tostring(root, encoding="utf-8", method="xml")
 
-    return pretty_text, None
+    return b'<?xml version="1.0" ?>\n' + data + b"\n", None
 
 
 def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
@@ -1174,7 +1274,7 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
 
     pth = context.output_dir / "schema.xsd"
     try:
-        pth.write_text(code, encoding="utf-8")
+        pth.write_bytes(code)
     except Exception as exception:
         run.write_error_report(
             message=f"Failed to write the XML Schema Definition to {pth}",
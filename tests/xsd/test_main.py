@@ -4,13 +4,19 @@ import contextlib
 import io
 import os
 import pathlib
+import sys
 import tempfile
+import textwrap
 import unittest
+import xml.etree.ElementTree as ET
+from typing import List
 
 import xmlschema
 import aas_core_meta.v3
 
 import aas_core_codegen.main
+from aas_core_codegen import specific_implementations
+from aas_core_codegen.common import Error, Stripped
 from aas_core_codegen.xsd import main as xsd_main
 
 import tests.common
@@ -105,6 +111,185 @@ class Test_translate_pattern(unittest.TestCase):
             self.assertEqual(expected, fixed, identifier)
 
 
+class Test_indent_in_place(unittest.TestCase):
+    # NOTE (agent, 2026-10-15):
+    # The leaf ``c`` has a text, and the elements ``c`` and ``d`` have
+    # a non-whitespace tail which must be preserved.
+    SOURCE = (
+        "<a>   <b><c>some text</c>tail text<d x='1' />trailing text</b><e/>\n"
+        "  <f><g><h /></g></f></a>"
+    )
+
+    def test_against_expected(self) -> None:
+        element = ET.fromstring(Test_indent_in_place.SOURCE)
+        xsd_main._indent_in_place(element)
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                <a>
+                  <b>
+                    <c>some text</c>tail text<d x="1" />trailing text</b>
+                  <e />
+                  <f>
+                    <g>
+                      <h />
+                    </g>
+                  </f>
+                </a>"""
+            ),
+            ET.tostring(element, encoding="unicode"),
+        )
+
+    def test_against_element_tree_indent(self) -> None:
+        if sys.version_info < (3, 9):
+            self.skipTest("ElementTree.indent is available only in Python 3.9+")
+
+        element = ET.fromstring(Test_indent_in_place.SOURCE)
+        xsd_main._indent_in_place(element)
+
+        expected_element = ET.fromstring(Test_indent_in_place.SOURCE)
+        ET.indent(expected_element, space="  ")
+
+        self.assertEqual(
+            ET.tostring(expected_element, encoding="unicode"),
+            ET.tostring(element, encoding="unicode"),
+        )
+
+
+class Test_root_element(unittest.TestCase):
+    @staticmethod
+    def generate_with_root_element(root_element: str) -> List[Error]:
+        symbol_table = tests.common.must_translate_source_to_intermediate(
+            source=textwrap.dedent(
+                """\
+                class Something:
+                    pass
+
+                __version__ = "dummy"
+                __xml_namespace__ = "https://dummy.com"
+                """
+            )
+        )
+
+        code, errors = xsd_main._generate(
+            symbol_table=symbol_table,
+            spec_impls={
+                specific_implementations.ImplementationKey(
+                    "root_element.xml"
+                ): Stripped(root_element)
+            },
+        )
+        assert code is None
+        assert errors is not None
+
+        return errors
+
+    def test_malformed(self) -> None:
+        errors = Test_root_element.generate_with_root_element(
+            '<xs:schema xmlns="https://dummy.com"'
+        )
+
+        self.assertEqual(
+            "Failed to parse the root element from root_element.xml: "
+            "unclosed token: line 1, column 0",
+            tests.common.most_underlying_messages(errors),
+        )
+
+    def test_missing_xmlns(self) -> None:
+        errors = Test_root_element.generate_with_root_element(
+            textwrap.dedent(
+                """\
+                <xs:schema
+                        xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                        targetNamespace="https://dummy.com"
+                />"""
+            )
+        )
+
+        self.assertEqual(
+            "The implementation snippet for the root element "
+            "is missing the 'xmlns' attribute: root_element.xml",
+            tests.common.most_underlying_messages(errors),
+        )
+
+    def test_xmlns_only_on_a_nested_element(self) -> None:
+        errors = Test_root_element.generate_with_root_element(
+            textwrap.dedent(
+                """\
+                <xs:schema
+                        xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                        targetNamespace="https://dummy.com"
+                >
+                    <xs:element xmlns="https://dummy.com" name="something" />
+                </xs:schema>"""
+            )
+        )
+
+        self.assertEqual(
+            "The implementation snippet for the root element "
+            "is missing the 'xmlns' attribute: root_element.xml",
+            tests.common.most_underlying_messages(errors),
+        )
+
+    def test_unexpected_xmlns(self) -> None:
+        errors = Test_root_element.generate_with_root_element(
+            textwrap.dedent(
+                """\
+                <xs:schema
+                        xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                        xmlns="https://another.com"
+                        targetNamespace="https://dummy.com"
+                />"""
+            )
+        )
+
+        self.assertEqual(
+            "The 'xmlns' attribute of the implementation snippet "
+            "root_element.xml for the root element "
+            "and the '__xml_namespace__' of the meta-model do not coincide: "
+            "'https://another.com' != 'https://dummy.com'",
+            tests.common.most_underlying_messages(errors),
+        )
+
+    def test_missing_target_namespace(self) -> None:
+        errors = Test_root_element.generate_with_root_element(
+            textwrap.dedent(
+                """\
+                <xs:schema
+                        xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                        xmlns="https://dummy.com"
+                />"""
+            )
+        )
+
+        self.assertEqual(
+            "The implementation snippet for the root element "
+            "is missing the 'targetNamespace' attribute: root_element.xml",
+            tests.common.most_underlying_messages(errors),
+        )
+
+    def test_unexpected_target_namespace(self) -> None:
+        errors = Test_root_element.generate_with_root_element(
+            textwrap.dedent(
+                """\
+                <xs:schema
+                        xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                        xmlns="https://dummy.com"
+                        targetNamespace="https://another.com"
+                />"""
+            )
+        )
+
+        self.assertEqual(
+            "The 'targetNamespace' attribute of the implementation snippet "
+            "root_element.xml for the root element "
+            "and the '__xml_namespace__' of the meta-model do not coincide: "
+            "'https://another.com' != 'https://dummy.com'",
+            tests.common.most_underlying_messages(errors),
+        )
+
+
 class Test_against_recorded(unittest.TestCase):
     _REPO_DIR = pathlib.Path(os.path.realpath(__file__)).parent.parent.parent
     PARENT_CASE_DIR = _REPO_DIR / "test_data" / "xsd" / "test_main"